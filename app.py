@@ -177,6 +177,90 @@ def card_close() -> None:
     st.markdown("</div>", unsafe_allow_html=True)
 
 
+# -----------------------------------------------------------------------------
+# Paginación
+# -----------------------------------------------------------------------------
+PAGE_SIZE = 50  # filas por página en tablas y listados
+
+
+def paginar(total: int, key: str) -> tuple[int, int]:
+    """Muestra un selector de página (si hace falta) y devuelve el rango [inicio, fin)."""
+    n_paginas = -(-total // PAGE_SIZE)
+    if n_paginas <= 1:
+        return 0, total
+
+    # Clave fija: la página elegida se conserva aunque cambie el número de páginas
+    if st.session_state.get(key, 1) > n_paginas:
+        st.session_state[key] = n_paginas
+    pagina = int(st.number_input("Página", min_value=1, max_value=n_paginas, step=1, key=key))
+
+    inicio = (pagina - 1) * PAGE_SIZE
+    fin = min(inicio + PAGE_SIZE, total)
+    st.caption(f"Página {pagina} de {n_paginas}: mostrando {inicio + 1:,}–{fin:,} de {total:,}.")
+    return inicio, fin
+
+
+# -----------------------------------------------------------------------------
+# Gráficos (submuestreo en el servidor)
+# -----------------------------------------------------------------------------
+CHART_MAX_POINTS = 500  # filas máximas por gráfico enviadas al navegador
+
+
+def lttb_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Índices elegidos por Largest-Triangle-Three-Buckets (conserva picos y forma).
+
+    >>> y = np.zeros(1000)
+    >>> y[437] = 50.0
+    >>> idx = lttb_indices(y, 100)
+    >>> len(idx), int(idx[0]), int(idx[-1])
+    (100, 0, 999)
+    >>> bool(np.all(np.diff(idx) > 0)), 437 in idx
+    (True, True)
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Primer y último punto fijos; el resto se reparte en n_out - 2 cubetas
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=int)
+    idx[0], idx[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        nxt_start = edges[i + 1]
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = (nxt_start + nxt_end - 1) / 2.0
+        avg_y = y[nxt_start:nxt_end].mean()
+
+        xs = np.arange(start, end, dtype=float)
+        area = np.abs((a - avg_x) * (y[start:end] - y[a]) - (a - xs) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+
+    return idx
+
+
+def downsample_frame(df: pd.DataFrame, columns: List[str], max_points: int = CHART_MAX_POINTS) -> pd.DataFrame:
+    """Reduce df a lo sumo max_points filas (max_points // len(columns) elegidas por columna con LTTB).
+
+    >>> df = pd.DataFrame({c: np.arange(1000.0) for c in "abcd"})
+    >>> len(downsample_frame(df, list("abcd"), 100)) <= 100, len(downsample_frame(df, list("abcd"), 8))
+    (True, 8)
+    """
+    if len(df) <= max_points:
+        return df
+    por_columna = max_points // len(columns)
+    if por_columna < 3:
+        # Muy pocos puntos para LTTB: muestreo uniforme por filas
+        keep = np.unique(np.linspace(0, len(df) - 1, max_points).astype(int))
+    else:
+        keep = np.unique(np.concatenate([lttb_indices(df[c].to_numpy(), por_columna) for c in columns]))
+    return df.iloc[keep]
+
+
 # -----------------------------------------------------------------------------
 # Estados por módulo 
 # -----------------------------------------------------------------------------
@@ -390,9 +474,12 @@ def render_ejercicio_2() -> None:
     df["diferencia"] = df["presupuesto"] - df["gasto_real"]
     df["estado"] = np.where(df["gasto_real"] <= df["presupuesto"], "✅ Cumple", "⚠️ Excede")
 
+    # Paginación: la tabla y las tarjetas solo muestran PAGE_SIZE actividades
     st.subheader("📋 Actividades registradas")
+    inicio, fin = paginar(len(actividades), "e2_pagina")
+
     st.dataframe(
-        df[["nombre", "tipo", "presupuesto", "gasto_real", "diferencia", "estado"]].style.format(
+        df.iloc[inicio:fin][["nombre", "tipo", "presupuesto", "gasto_real", "diferencia", "estado"]].style.format(
             {"presupuesto": "S/ {:,.2f}", "gasto_real": "S/ {:,.2f}", "diferencia": "S/ {:,.2f}"}
         ),
         use_container_width=True,
@@ -400,7 +487,7 @@ def render_ejercicio_2() -> None:
     )
 
     st.subheader(" Evaluación por actividad")
-    for i, act in enumerate(actividades, start=1):
+    for i, act in enumerate(actividades[inicio:fin], start=inicio + 1):
         nombre = act["nombre"]
         tipo = act["tipo"]
         presupuesto = act["presupuesto"]
@@ -440,6 +527,26 @@ def render_ejercicio_2() -> None:
         c3.metric("Diferencia", f"S/ {total_diff:,.2f}")
         c4.metric("Cumplen", f"{cumplen}/{total}")
 
+    st.subheader("📈 Presupuesto vs gasto por actividad")
+    columnas = ["presupuesto", "gasto_real"]
+    if len(df) <= CHART_MAX_POINTS:
+        # Etiquetas con ceros a la izquierda: el eje nominal se ordena alfabéticamente
+        ancho = len(str(len(df)))
+        df_chart = df[columnas].copy()
+        df_chart.index = [f"{i:0{ancho}d}. {n}" for i, n in enumerate(df["nombre"], start=1)]
+        st.bar_chart(df_chart, stack=False)
+    else:
+        # Con muchas actividades se envían solo puntos elegidos por LTTB, sin unirlos
+        # con líneas: actividades consecutivas no guardan relación entre sí
+        df_chart = df[columnas].copy()
+        df_chart.index = pd.RangeIndex(1, len(df) + 1, name="N° actividad")
+        df_chart = downsample_frame(df_chart, columnas)
+        st.scatter_chart(df_chart)
+        st.caption(
+            f"Mostrando {len(df_chart):,} de {len(df):,} actividades (submuestreo LTTB). "
+            "El eje X es solo el número de fila en el orden de registro."
+        )
+
     st.button(
         "🗑️ Limpiar todas las actividades",
         type="secondary",
@@ -497,9 +604,11 @@ def render_ejercicio_3() -> None:
             )
             st.success(f"Actividad '{nombre.strip()}' agregada.")
 
+    # Paginación: ambas tablas muestran solo la página elegida; los totales usan todas las filas
     actividades: List[Dict] = st.session_state["e3_actividades"]
+    inicio, fin = paginar(len(actividades), "e3_pagina")
     if actividades:
-        df = pd.DataFrame(actividades)
+        df = pd.DataFrame(actividades[inicio:fin])
         st.dataframe(df, use_container_width=True, hide_index=True)
 
     card_close()
@@ -523,7 +632,7 @@ def render_ejercicio_3() -> None:
         df_r = pd.DataFrame(resultados)
         st.subheader("📌 Resultados")
         st.dataframe(
-            df_r.style.format({"presupuesto": "S/ {:,.2f}", "retorno": "S/ {:,.2f}"}),
+            df_r.iloc[inicio:fin].style.format({"presupuesto": "S/ {:,.2f}", "retorno": "S/ {:,.2f}"}),
             use_container_width=True,
             hide_index=True,
         )
@@ -537,6 +646,14 @@ def render_ejercicio_3() -> None:
         c2.metric("Retorno total", f"S/ {total_ret:,.2f}")
         c3.metric("Ganancia", f"S/ {ganancia:,.2f}")
 
+        # Serie agregada: un punto por mes (meses <= 60), sin importar cuántas actividades haya
+        st.subheader("📈 Crecimiento del retorno por mes")
+        df_mes = pd.DataFrame(
+            {"Retorno acumulado": [calcular_retorno(total_inv, tasa, m) for m in range(1, int(meses) + 1)]},
+            index=pd.RangeIndex(1, int(meses) + 1, name="Mes"),
+        )
+        st.line_chart(df_mes)
+
 
 # -----------------------------------------------------------------------------
 # Ejercicio 4 – Programación Orientada a Objetos (POO)